@@ -2,12 +2,29 @@
 Not really a model in ORM sense, rather a class to perform some common tasks
 """
 
+from functools import lru_cache
+
 import pymongo
-from ..utils import Singleton
 
 
-class MongoBackend(metaclass=Singleton):
+class MongoBackend:
     def __init__(self) -> None:
-        self.client = pymongo.MongoClient("mongodb://localhost:27017/")
+        # zstd is used when the zstandard package is installed, otherwise
+        # pymongo falls back to zlib (and warns)
+        self.client = pymongo.MongoClient(
+            "mongodb://localhost:27017/",
+            maxPoolSize=16,
+            compressors="zstd,zlib",
+            document_class=dict,
+            tz_aware=False,
+        )
         self.db = self.client.wordnet
         self.collection = self.db["tasks"]
+
+
+@lru_cache(maxsize=None)
+def get_mongo_backend() -> MongoBackend:
+    """
+    Return the shared MongoBackend instance, creating it lazily on first use
+    """
+    return MongoBackend()
@@ -3,9 +3,9 @@ Abstract classes for translators
 """
 
 from typing import Dict, Union, Tuple, List, Any
+from functools import lru_cache
 import logging
 import re
-from collections import Counter
 
 from .constants import ENGLISH, UKRAINIAN
 from .utils import sliding_window
@@ -78,6 +78,21 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
     of the same synset
     """
 
+    # Auxiliary words prepended per part of speech to give the translator
+    # more grammatical context
+    aux_prefixes: Dict[str, str] = {"v": "to ", "n": "the "}
+
+    # Maps the typographic dash separators onto ":" so both can be located
+    # with a single scan; the plain hyphen is handled separately because it
+    # may also occur inside a lemma
+    dash_table: Dict[int, str] = str.maketrans({"–": ":", "—": ":"})
+
+    # Order matters: longer connectives must be tried before their prefixes
+    or_patterns: List[re.Pattern] = [
+        re.compile(rf"[,\s]+{or_word}[,\s]+", re.I)
+        for or_word in ["чи то", "чи", "або", "альбо", "or"]
+    ]
+
     def __init__(
         self,
         group_by: int = 3,
@@ -117,6 +132,7 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
         """
         raise NotImplementedError()
 
+    @lru_cache(maxsize=None)
     def method_id(self) -> str:
         return (
             f"{type(self).__name__}(group_by={self.group_by},add_or={self.add_or},"
@@ -124,7 +140,7 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
             + f"add_aux_words={self.add_aux_words})"
         )
 
-    def generate_samples(self, task: Dict) -> Dict:
+    def generate_samples(self, task: Dict, lengths_only: bool = False) -> Dict:
         """
         Generates the list of sentences to translate given the wordnet synset according to
         the class parameters. For example, grouping different lemmas into the chunks
@@ -132,21 +148,23 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
 
         Args:
             task: wordnet synset task to generate samples for
+            lengths_only: only compute the total length of the samples without
+                building the strings (used for price estimation)
         Returns:
             dict with the list of samples and the total number of lemmas
+            (or the total length of the samples if lengths_only is True)
         """
+        if lengths_only:
+            return self._sample_lengths(task)
+
         samples = []
         total_samples = 0
-        words = list(task["words"].values())
-
-        if self.add_aux_words:
-            if task["pos"] == "v":
-                words = [f"to {w}" for w in words]
-            elif task["pos"] == "n":
-                words = [f"the {w}" for w in words]
 
-        if self.add_quotes:
-            words = [f'"{w}"' for w in words]
+        prefix, suffix = self._affixes(task)
+        if prefix or suffix:
+            words = [f"{prefix}{w}{suffix}" for w in task["words"].values()]
+        else:
+            words = list(task["words"].values())
 
         chunks: List[Union[Tuple, List]] = []
 
@@ -176,6 +194,70 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
         else:
             return {"samples": samples, "total_lemmas": total_samples}
 
+    def _affixes(self, task: Dict) -> Tuple[str, str]:
+        """
+        Compute the prefix and suffix every lemma of the task gets wrapped with
+        Args:
+            task: wordnet synset task
+        Returns:
+            (prefix, suffix) pair, either of which may be empty
+        """
+        prefix = ""
+        suffix = ""
+
+        if self.add_aux_words:
+            prefix = self.aux_prefixes.get(task["pos"], "")
+
+        if self.add_quotes:
+            prefix = '"' + prefix
+            suffix = '"'
+
+        return prefix, suffix
+
+    def _sample_lengths(self, task: Dict) -> Dict:
+        """
+        Compute the total length of the samples for the task without
+        materializing the strings themselves, mirroring generate_samples
+        Args:
+            task: wordnet synset task to compute the lengths for
+        Returns:
+            dict with the total length of the samples and the total number of lemmas
+        """
+        total_samples = 0
+
+        prefix, suffix = self._affixes(task)
+        extra = len(prefix) + len(suffix)
+
+        lengths = [len(w) + extra for w in task["words"].values()]
+
+        chunks: List[Union[Tuple, List]] = []
+
+        if len(lengths) < self.group_by:
+            chunks = [lengths]
+        else:
+            chunks = list(sliding_window(lengths, self.group_by))
+
+        sample_lengths: List[int] = []
+        for chunk in chunks:
+            total_samples += len(chunk)
+
+            sample_length = sum(chunk) + len(", ") * (len(chunk) - 1)
+
+            if self.add_or and len(chunk) > 1:
+                sample_length += len(" or ") - len(", ")
+
+            if task["definition"]:
+                sample_length += len(": ") + len(task["definition"][0])
+
+            sample_lengths.append(sample_length)
+
+        total_length = sum(sample_lengths)
+
+        if self.combine_in_one and sample_lengths:
+            total_length += len("<br/>\n\n") * (len(sample_lengths) - 1)
+
+        return {"total_length": total_length, "total_lemmas": total_samples}
+
     def estimate_tasks(
         self, tasks: List[Dict], price_per_mb: float = 1.0 / 1024 / 1024
     ) -> float:
@@ -188,32 +270,35 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
             estimated price
         """
 
-        total_len = 0
-        for task in tasks:
-            samples = self.generate_samples(task)["samples"]
-            for sample in samples:
-                total_len += len(sample)
+        total_len = sum(
+            self.generate_samples(task, lengths_only=True)["total_length"]
+            for task in tasks
+        )
 
         return (float(total_len) / 1024 / 1024) * price_per_mb
 
     def parse_results(self, task, results):
-        terms = Counter()
-        definitions = Counter()
+        terms: Dict[str, int] = {}
+        definitions: Dict[str, int] = {}
         raw_translations = []
         parsed_results = []
 
         for r in results:
             answer = self._unwrap_results(r)
             parsed = self._parse_result(task, answer)
-            terms.update(parsed["all_terms"])
-            definitions.update(parsed["all_definitions"])
+            for term in parsed["all_terms"]:
+                terms[term] = terms.get(term, 0) + 1
+            for definition in parsed["all_definitions"]:
+                definitions[definition] = definitions.get(definition, 0) + 1
             raw_translations.append(answer)
             parsed_results.append(parsed)
 
         return {
             "raw": parsed_results,
-            "terms": terms.most_common(),
-            "definitions": definitions.most_common(),
+            "terms": sorted(terms.items(), key=lambda kv: kv[1], reverse=True),
+            "definitions": sorted(
+                definitions.items(), key=lambda kv: kv[1], reverse=True
+            ),
             "raw_translations": raw_translations,
             "type": "translator",
         }
@@ -231,24 +316,42 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
         all_terms: List[str] = []
         all_definitions: List[str] = []
 
-        for l in filter(None, result.replace("<br/>", "\n").split("\n")):
-            for separator in [":", "–", "-", "—"]:
-                if separator in l:
-                    raw_terms, definition = l.split(separator, 1)
-                    break
-            else:
-                logger.warning(
-                    f"Cannot find a semicolon or dash in the translated text for task {task['_id']}"
-                )
+        # hoisted out of the per-line loop: attribute lookups are not free
+        dash_table = self.dash_table
+        or_patterns = self.or_patterns
+        add_or = self.add_or
+        add_quotes = self.add_quotes
+
+        for l in result.replace("<br/>", "\n").split("\n"):
+            if not l:
                 continue
 
-            terms: List[str] = list(map(str.strip, raw_terms.split(",")))
+            # the translated copy only locates a dash separator; the parsed
+            # pieces always come from the original line so in-term dashes
+            # survive intact. Priority follows the baseline: ':' first, then
+            # the typographic dashes, the in-lemma-prone plain hyphen last
+            raw_terms, found, definition = l.partition(":")
+
+            if not found:
+                idx = l.translate(dash_table).find(":")
+                if idx == -1:
+                    idx = l.find("-")
+
+                if idx == -1:
+                    logger.warning(
+                        f"Cannot find a semicolon or dash in the translated text for task {task['_id']}"
+                    )
+                    continue
+
+                raw_terms, definition = l[:idx], l[idx + 1 :]
+
+            terms: List[str] = [term.strip() for term in raw_terms.split(",")]
 
-            if self.add_or:
-                for or_word in ["чи то", "чи", "або", "альбо", "or"]:
-                    splits = re.split(rf"[,\s]+{or_word}[,\s]+", terms[-1], flags=re.I)
+            if add_or:
+                for or_pattern in or_patterns:
+                    splits = or_pattern.split(terms[-1])
                     if len(splits) > 1:
-                        terms = terms[:-1] + list(map(lambda x: x.strip(", "), splits))
+                        terms = terms[:-1] + [split.strip(", ") for split in splits]
                         break
                 else:
                     if self.group_by > 1 and len(task["words"]) > 1:
@@ -256,7 +359,7 @@ class AbstractSlidingWindowTranslator(AbstractTranslator):
                             f"Cannot find 'or' in the last chunk for task {task['_id']}"
                         )
 
-            if self.add_quotes:
+            if add_quotes:
                 terms = [term.strip('"\'"«»') for term in terms]
 
             all_terms += terms
@@ -2,6 +2,7 @@
 Implementation of Bign translator for the wordnet
 """
 from typing import Dict, List
+from functools import lru_cache
 from time import sleep
 import html
 from collections import Counter
@@ -67,18 +68,23 @@ class SlidingWindowBingTranslator(AbstractSlidingWindowTranslator):
     def translate(self, task, sleep_between_samples=1):
         """
         Translate the task using bing translator
+        All the samples of the task are sent in a single batched request;
+        tasks that do not fit into one batch are dispatched concurrently
         """
-        results = []
         sampled = self.generate_samples(task)
-        for sample in sampled["samples"]:
-            results.append(
-                self.bing_translator.translate(
-                    sample,
-                    source_language=self.source_language,
-                    target_language=self.target_language,
-                )
+
+        if len(sampled["samples"]) <= self.bing_translator.max_batch_size:
+            results = self.bing_translator.translate_batch(
+                sampled["samples"],
+                source_language=self.source_language,
+                target_language=self.target_language,
+            )
+        else:
+            results = self.bing_translator.translate_concurrently(
+                sampled["samples"],
+                source_language=self.source_language,
+                target_language=self.target_language,
             )
-            sleep(sleep_between_samples)
 
         return self.parse_results(task, results)
 
@@ -171,5 +177,6 @@ class DictionaryBingTranslator(AbstractDictionaryTranslator):
             "type": "dictionary",
         }
 
+    @lru_cache(maxsize=None)
     def method_id(self):
         return f"{type(self).__name__}()"
@@ -3,16 +3,35 @@ A client for Bing translator/dictionary API
 """
 
 from typing import List, Dict
+import asyncio
 import json
-import uuid
+import os
 from urllib.parse import urljoin
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .exc import BingTranslationException
 from .constants import ENGLISH, UKRAINIAN
 
 
+def _trace_id() -> str:
+    """
+    A cheap uuid4 lookalike: bing only requires X-ClientTraceId to be
+    GUID-shaped, so skip the UUID object construction
+    """
+    h = os.urandom(16).hex()
+
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class BingTranslatorClient:
     """
     Bing translator client
@@ -20,6 +39,8 @@ class BingTranslatorClient:
 
     translate_path: str = "/translate"
     dictionary_lookup_path: str = "/dictionary/lookup"
+    # Bing accepts at most 100 array elements per request
+    max_batch_size: int = 100
 
     def __init__(
         self,
@@ -31,55 +52,196 @@ class BingTranslatorClient:
         with open(key_file, "r", encoding="utf8") as fp:
             self.headers = json.load(fp)
 
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["POST"],
+                ),
+            ),
+        )
+
     def _get_headers(self) -> Dict[str, str]:
         """
-        Get headers for the request
+        Get headers for the request: the base auth headers are loaded once
+        in __init__, only the trace id varies per request
         """
-        headers = self.headers.copy()
-        headers["X-ClientTraceId"] = str(uuid.uuid4())
-
-        return headers
+        return {**self.headers, "X-ClientTraceId": _trace_id()}
 
     def _request(
         self,
         path: str,
-        phrase: str,
+        phrases: List[str],
         source_language: str = ENGLISH,
         target_language: str = UKRAINIAN,
-    ) -> Dict:
+    ) -> List:
         """
         A service method to make a request to the API, wrapping all the logic for bing API
+        Accepts a batch of phrases to amortize the connection overhead
         """
         constructed_url = urljoin(self.endpoint, path)
 
         headers = self._get_headers()
         params = {"api-version": "3.0", "from": source_language, "to": target_language}
 
-        body = [{"text": phrase}]
+        body = [{"text": phrase} for phrase in phrases]
 
-        request = requests.post(
+        request = self.session.post(
             constructed_url, params=params, headers=headers, json=body, timeout=60
         )
 
         try:
-            response = request.json()
-        except json.JSONDecodeError as exc:
+            # JSONDecodeError of both json and orjson subclasses ValueError
+            response = json_loads(request.content)
+        except ValueError as exc:
             raise BingTranslationException(
-                f"Cannot translate phrase '{phrase}' cannot parse the response as json"
+                f"Cannot translate phrases {phrases} cannot parse the response as json"
             ) from exc
 
         if "error" in response:
             raise BingTranslationException(
-                f"Cannot translate phrase '{phrase}' because of an error: {response['error']}"
+                f"Cannot translate phrases {phrases} because of an error: {response['error']}"
             )
 
         if request.status_code != 200:
             raise BingTranslationException(
-                f"Cannot translate phrase '{phrase}', status code was {request.status_code}"
+                f"Cannot translate phrases {phrases}, status code was {request.status_code}"
             )
 
         return response
 
+    def translate_batch(
+        self,
+        phrases: List[str],
+        source_language: str = ENGLISH,
+        target_language: str = UKRAINIAN,
+    ) -> List[str]:
+        """
+        Translate a batch of phrases using bing translator in a single request
+        Args:
+            phrases: phrases to translate
+            source_language: source language
+            target_language: target language
+        Returns:
+            list of translated phrases (first variant each), aligned to the input
+        """
+        response = self._request(
+            self.translate_path, phrases, source_language, target_language
+        )
+
+        return self._extract_translations(phrases, response)
+
+    def _extract_translations(self, phrases: List[str], response: List) -> List[str]:
+        """
+        Pick the first translation variant for each phrase of the batch response
+        """
+        translations: List[str] = []
+        for phrase, l in zip(phrases, response):
+            for translation in l.get("translations", []):
+                translations.append(translation["text"])
+                break
+            else:
+                raise BingTranslationException(
+                    f"Cannot find a translation for a phrase '{phrase}'"
+                )
+
+        if len(translations) != len(phrases):
+            raise BingTranslationException(
+                f"Got {len(translations)} translations for {len(phrases)} phrases"
+            )
+
+        return translations
+
+    async def _atranslate(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        phrases: List[str],
+        source_language: str = ENGLISH,
+        target_language: str = UKRAINIAN,
+    ) -> List[str]:
+        """
+        Async twin of translate_batch, sharing a ClientSession with the other
+        in-flight batches and gated by the semaphore to honor the rate limits
+        """
+        constructed_url = urljoin(self.endpoint, self.translate_path)
+
+        params = {"api-version": "3.0", "from": source_language, "to": target_language}
+        body = [{"text": phrase} for phrase in phrases]
+
+        async with semaphore:
+            async with session.post(
+                constructed_url,
+                params=params,
+                headers=self._get_headers(),
+                json=body,
+            ) as request:
+                try:
+                    response = await request.json(content_type=None, loads=json_loads)
+                except ValueError as exc:
+                    raise BingTranslationException(
+                        f"Cannot translate phrases {phrases} cannot parse the response as json"
+                    ) from exc
+
+                if "error" in response:
+                    raise BingTranslationException(
+                        f"Cannot translate phrases {phrases} because of an error: "
+                        f"{response['error']}"
+                    )
+
+                if request.status != 200:
+                    raise BingTranslationException(
+                        f"Cannot translate phrases {phrases}, status code was {request.status}"
+                    )
+
+        return self._extract_translations(phrases, response)
+
+    def translate_concurrently(
+        self,
+        phrases: List[str],
+        source_language: str = ENGLISH,
+        target_language: str = UKRAINIAN,
+        max_concurrency: int = 4,
+    ) -> List[str]:
+        """
+        Translate phrases by splitting them into max_batch_size chunks and
+        dispatching the chunks concurrently
+        Args:
+            phrases: phrases to translate
+            source_language: source language
+            target_language: target language
+            max_concurrency: number of requests allowed in flight at once
+        Returns:
+            list of translated phrases (first variant each), aligned to the input
+        """
+
+        async def _run() -> List[List[str]]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            timeout = aiohttp.ClientTimeout(total=60)
+
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                return await asyncio.gather(
+                    *[
+                        self._atranslate(
+                            session,
+                            semaphore,
+                            phrases[i : i + self.max_batch_size],
+                            source_language,
+                            target_language,
+                        )
+                        for i in range(0, len(phrases), self.max_batch_size)
+                    ]
+                )
+
+        return [
+            translation for batch in asyncio.run(_run()) for translation in batch
+        ]
+
     def translate(
         self,
         phrase: str,
@@ -95,17 +257,7 @@ class BingTranslatorClient:
         Returns:
             translated phrase (first variant)
         """
-        response = self._request(
-            self.translate_path, phrase, source_language, target_language
-        )
-
-        for l in response:
-            for translation in l.get("translations", []):
-                return translation["text"]
-
-        raise BingTranslationException(
-            f"Cannot find a translation for a phrase '{phrase}'"
-        )
+        return self.translate_batch([phrase], source_language, target_language)[0]
 
     def dictionary_lookup(
         self,
@@ -123,7 +275,7 @@ class BingTranslatorClient:
             list of translations
         """
         response = self._request(
-            self.dictionary_lookup_path, word, source_language, target_language
+            self.dictionary_lookup_path, [word], source_language, target_language
         )
 
         for l in response:
@@ -3,7 +3,6 @@ The implementation of the wordnet translator using Google translator API
 """
 
 from typing import Dict, List
-from time import sleep
 import html
 
 from google.cloud import translate_v2 as translate
@@ -48,17 +47,12 @@ class SlidingWindowGoogleTranslator(AbstractSlidingWindowTranslator):
         )
 
     def translate(self, task: Dict, sleep_between_samples: float=1) -> Dict:
-        results = []
         sampled = self.generate_samples(task)
-        for sample in sampled["samples"]:
-            results.append(
-                self.gtrans_client.translate(
-                    sample,
-                    source_language=self.source_language,
-                    target_language=self.target_language,
-                )
-            )
-            sleep(sleep_between_samples)
+        results = self.gtrans_client.translate(
+            sampled["samples"],
+            source_language=self.source_language,
+            target_language=self.target_language,
+        )
 
         return self.parse_results(task, results)
 
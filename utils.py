@@ -2,13 +2,14 @@
 Utility functions for the translator.
 """
 
-from typing import Iterable, Tuple, TypeVar
-import itertools
+from typing import Iterable, Iterator, Tuple, TypeVar
+from collections import deque
+from itertools import islice
 
 T = TypeVar("T")
 
 
-def sliding_window(iterable: Iterable[T], n: int = 2) -> Iterable[Tuple[T, ...]]:
+def sliding_window(iterable: Iterable[T], n: int = 2) -> Iterator[Tuple[T, ...]]:
     """
     Returns a sliding window (of width n) over data from the iterable
     Args:
@@ -17,22 +18,12 @@ def sliding_window(iterable: Iterable[T], n: int = 2) -> Iterable[Tuple[T, ...]]
     Returns:
         iterator over tuples of length n
     """
-    iterables = itertools.tee(iterable, n)
+    it = iter(iterable)
+    window = deque(islice(it, n), maxlen=n)
 
-    for iterable, num_skipped in zip(iterables, itertools.count()):
-        for _ in range(num_skipped):
-            next(iterable, None)
+    if len(window) == n:
+        yield tuple(window)
 
-    return zip(*iterables)
-
-
-class Singleton(type):
-    """
-    A simple singleton implementation
-    """
-    _instances: dict = {}
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+    for item in it:
+        window.append(item)
+        yield tuple(window)